@@ -0,0 +1,15 @@
+# Generate data to interpolate (e.g. a propagated state history)
+data_to_interpolate = dict( )
+data_to_interpolate = ...
+
+# Create settings for interpolation (using the default hunting algorithm to look up the interval of each epoch)
+interpolation_settings = interpolators.lagrange_interpolation( 8 )
+
+# Create interpolator (once)
+interpolator = interpolators.create_one_dimensional_vector_interpolator( data_to_interpolate, interpolation_settings )
+
+# Sort the epochs at which to interpolate, such that each lookup starts from the interval of the previous one
+observation_epochs = np.sort( observation_epochs )
+
+# Interpolate at all epochs, and stack the results into an (N, 6) array
+interpolated_states = np.vstack( [ interpolator.interpolate( epoch ) for epoch in observation_epochs ] )
@@ -5,10 +5,10 @@ data_to_interpolate = ...
 data_derivatives = ...
 
 # Create settings for Hermite spline interpolation
-linear_interpolation_settings = interpolators.hermite_interpolation( )
+hermite_interpolation_settings = interpolators.hermite_spline_interpolation( )
 
 # Create interpolator
-interpolator = interpolators.create_one_dimensional_scalar_interpolator( data_to_interpolate, linear_interpolation_settings, data_derivatives )
+interpolator = interpolators.create_one_dimensional_scalar_interpolator( data_to_interpolate, hermite_interpolation_settings, data_derivatives )
 
 # Interpolate data set in data_to_interpolate at t=100
 independent_variable = 100
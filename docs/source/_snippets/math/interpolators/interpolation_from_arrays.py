@@ -0,0 +1,15 @@
+# Data set as arrays: epochs with shape (M,), values and derivatives with shape (M, 6)
+data_epochs = ...
+data_values = ...
+data_derivatives = ...
+
+# Create the dicts in a single pass, without copying the rows on the Python side
+data_to_interpolate = dict( zip( data_epochs, data_values ) )
+derivatives_to_interpolate = dict( zip( data_epochs, data_derivatives ) )
+
+# Create interpolator
+interpolator = interpolators.create_one_dimensional_vector_interpolator(
+    data_to_interpolate, interpolators.hermite_spline_interpolation( ), derivatives_to_interpolate )
+
+# Release the dicts, the interpolator holds its own copy of the data
+del data_to_interpolate, derivatives_to_interpolate
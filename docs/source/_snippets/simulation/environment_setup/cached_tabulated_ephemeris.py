@@ -0,0 +1,56 @@
+def tabulated_state_cache_file(cache_directory, body, frame_origin, frame_orientation,
+                               initial_time, final_time, time_step, kernel_files):
+    """
+    Function that returns the cache file name for a table of states. The name is a hash of the body, frame, time grid
+    and the path, size and modification time of each of the loaded kernel files, such that a table is automatically
+    recomputed when any of these change.
+    """
+    kernel_signatures = [(os.path.abspath(kernel_file), os.path.getsize(kernel_file), os.path.getmtime(kernel_file))
+                         for kernel_file in kernel_files]
+    cache_key = repr((body, frame_origin, frame_orientation, initial_time, final_time, time_step, kernel_signatures))
+    return os.path.join(cache_directory, hashlib.sha256(cache_key.encode()).hexdigest() + ".npy")
+
+
+def get_cached_state_table(cache_directory, body, frame_origin, frame_orientation,
+                           initial_time, final_time, time_step, kernel_files):
+    """
+    Function that returns the table of states of a body (epoch in the first column, Cartesian state in the next six),
+    as an array. The table is computed from SPICE and written to disk only if it is not yet in the cache.
+    """
+    cache_file = tabulated_state_cache_file(cache_directory, body, frame_origin, frame_orientation,
+                                            initial_time, final_time, time_step, kernel_files)
+    if not os.path.exists(cache_file):
+        epochs = np.arange(initial_time, final_time + time_step / 2.0, time_step)
+        states = [spice.get_body_cartesian_state_at_epoch(body, frame_origin, frame_orientation, "NONE", epoch)
+                  for epoch in epochs]
+
+        # Write under a temporary name first, such that other processes never open an incomplete file
+        os.makedirs(cache_directory, exist_ok=True)
+        temporary_file = f"{cache_file}.{os.getpid()}.tmp.npy"
+        np.save(temporary_file, np.column_stack((epochs, states)))
+        os.replace(temporary_file, cache_file)
+
+    return np.load(cache_file)
+
+
+# Kernels that are loaded, and that define the cached tables
+kernel_files = [...]
+for kernel_file in kernel_files:
+    spice.load_kernel(kernel_file)
+
+# Create default body settings, and replace the ephemerides by tables from the cache
+bodies_to_create = ["Sun", "Earth", "Moon", "Mars", "Jupiter"]
+global_frame_origin = "SSB"
+global_frame_orientation = "J2000"
+body_settings = environment_setup.get_default_body_settings(
+    bodies_to_create, global_frame_origin, global_frame_orientation)
+
+initial_time = 2.0 * constants.JULIAN_YEAR
+final_time = 4.0 * constants.JULIAN_YEAR
+time_step = 300.0
+for body in bodies_to_create:
+    state_table = get_cached_state_table(
+        "ephemeris_cache", body, global_frame_origin, global_frame_orientation,
+        initial_time, final_time, time_step, kernel_files)
+    body_settings.get(body).ephemeris_settings = environment_setup.ephemeris.tabulated(
+        dict(zip(state_table[:, 0], state_table[:, 1:])), global_frame_origin, global_frame_orientation)
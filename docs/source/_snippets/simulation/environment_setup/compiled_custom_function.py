@@ -0,0 +1,54 @@
+# Acceleration due to a set of point masses (mascons), computed with a Python loop
+def mascon_acceleration(position, mascon_positions, mascon_gravitational_parameters):
+    acceleration = np.zeros(3)
+    for mascon_index in range(mascon_gravitational_parameters.shape[0]):
+        relative_position = mascon_positions[mascon_index] - position
+        distance = np.sqrt(relative_position[0] ** 2 + relative_position[1] ** 2 + relative_position[2] ** 2)
+        acceleration += mascon_gravitational_parameters[mascon_index] * relative_position / distance ** 3
+    return acceleration
+
+
+# Same function, compiled to machine code by Numba
+mascon_acceleration_compiled = numba.njit(cache=True)(mascon_acceleration)
+
+# Same function, vectorized with NumPy
+def mascon_acceleration_vectorized(position, mascon_positions, mascon_gravitational_parameters):
+    relative_positions = mascon_positions - position
+    distances = np.linalg.norm(relative_positions, axis=1)
+    return (mascon_gravitational_parameters / distances ** 3) @ relative_positions
+
+
+# Define the custom acceleration function for the vehicle, using any of the above implementations
+def create_custom_acceleration_function(implementation):
+    vehicle = bodies.get("Vehicle")
+
+    def custom_acceleration_function(current_time: float):
+        return implementation(vehicle.position, mascon_positions, mascon_gravitational_parameters)
+
+    return custom_acceleration_function
+
+
+implementations = {
+    "Python loop": mascon_acceleration,
+    "NumPy": mascon_acceleration_vectorized,
+    "Numba": mascon_acceleration_compiled,
+    "constant (call overhead only)": lambda *args: np.zeros(3)}
+
+# Compile the Numba function before timing the propagation
+mascon_acceleration_compiled(np.ones(3), mascon_positions, mascon_gravitational_parameters)
+
+for implementation_name, implementation in implementations.items():
+    acceleration_settings = {"Vehicle": dict(
+        Earth=[propagation_setup.acceleration.point_mass_gravity()],
+        Vehicle=[propagation_setup.acceleration.custom_acceleration(
+            create_custom_acceleration_function(implementation))])}
+    propagator_settings = create_propagator_settings(acceleration_settings)
+    propagator_settings.print_settings.disable_all_printing()
+
+    start_time = time.perf_counter()
+    dynamics_simulator = dynamics.simulator.create_dynamics_simulator(bodies, propagator_settings)
+    wall_time = time.perf_counter() - start_time
+
+    function_evaluations = max(
+        dynamics_simulator.propagation_results.cumulative_number_of_function_evaluations_history.values())
+    print(f"{implementation_name:30s} {wall_time / function_evaluations * 1.0E6:8.2f} us per function evaluation")
@@ -0,0 +1,46 @@
+# Create physical environment
+bodies = environment_setup.create_system_of_bodies( ... )
+
+# Define the (N, 6) array of initial Cartesian states w.r.t. Earth, one row per ensemble member
+ensemble_initial_states = ...
+number_of_members = len(ensemble_initial_states)
+
+# Define the mass of each ensemble member
+ensemble_masses = ...
+
+# Create one body per ensemble member, and set member-specific properties (here: the mass)
+bodies_to_propagate = [f"Member{index}" for index in range(number_of_members)]
+central_bodies = ["Earth"] * number_of_members
+for body_name, member_mass in zip(bodies_to_propagate, ensemble_masses):
+    bodies.create_empty_body(body_name)
+    bodies.get(body_name).mass = member_mass
+
+# Define the same acceleration settings for all members
+accelerations_settings_member = dict(
+    Earth=[propagation_setup.acceleration.spherical_harmonic_gravity(5, 5)],
+    Moon=[propagation_setup.acceleration.point_mass_gravity()],
+    Sun=[propagation_setup.acceleration.point_mass_gravity()])
+acceleration_settings = {body_name: accelerations_settings_member for body_name in bodies_to_propagate}
+
+# Create acceleration models
+acceleration_models = propagation_setup.create_acceleration_models(
+    bodies, acceleration_settings, bodies_to_propagate, central_bodies)
+
+# Define translational propagator settings, with the initial states of all members concatenated into one vector
+propagator_settings = propagation_setup.propagator.translational(
+    central_bodies,
+    acceleration_models,
+    bodies_to_propagate,
+    ensemble_initial_states.flatten(),
+    simulation_start_epoch,
+    integrator_settings,
+    termination_settings)
+
+# Propagate all members in a single simulation
+dynamics_simulator = dynamics.simulator.create_dynamics_simulator(
+    bodies, propagator_settings)
+
+# Retrieve the epochs, and the states as an (n_epochs, N, 6) array
+states_array = result2array(dynamics_simulator.propagation_results.state_history)
+epochs = states_array[:, 0]
+ensemble_states = states_array[:, 1:].reshape(len(epochs), number_of_members, 6)
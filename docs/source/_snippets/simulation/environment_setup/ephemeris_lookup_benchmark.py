@@ -0,0 +1,40 @@
+def time_per_call(function, arguments, number_of_repeats=5):
+    """
+    Function that returns the best-of-n wall time per call (in microseconds) of the function over all arguments.
+    """
+    best_time = np.inf
+    for _ in range(number_of_repeats):
+        start_time = time.perf_counter()
+        for argument in arguments:
+            function(argument)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return 1.0E6 * best_time / len(arguments)
+
+
+# Create the same bodies with direct SPICE ephemerides, and with tabulated (time-limited) ephemerides
+bodies_to_create = ["Sun", "Earth", "Moon"]
+initial_time = 2.0 * constants.JULIAN_YEAR
+final_time = initial_time + 30.0 * constants.JULIAN_DAY
+spice_bodies = environment_setup.create_system_of_bodies(environment_setup.get_default_body_settings(
+    bodies_to_create, "SSB", "J2000"))
+tabulated_bodies = environment_setup.create_system_of_bodies(environment_setup.get_default_body_settings_time_limited(
+    bodies_to_create, initial_time, final_time, "SSB", "J2000", 300.0))
+
+# Query epochs, away from the edges of the tabulated interval, in sorted and in random order
+sorted_epochs = np.linspace(initial_time + 1.0 * constants.JULIAN_DAY, final_time - 1.0 * constants.JULIAN_DAY, 100000)
+random_epochs = np.random.permutation(sorted_epochs)
+
+spice_ephemeris = spice_bodies.get("Moon").ephemeris
+tabulated_ephemeris = tabulated_bodies.get("Moon").ephemeris
+print(f"SPICE ephemeris:                      {time_per_call(spice_ephemeris.cartesian_state, sorted_epochs):.2f} us/call")
+print(f"Tabulated ephemeris, sorted epochs:   {time_per_call(tabulated_ephemeris.cartesian_state, sorted_epochs):.2f} us/call")
+print(f"Tabulated ephemeris, random epochs:   {time_per_call(tabulated_ephemeris.cartesian_state, random_epochs):.2f} us/call")
+
+# Compare the lookup schemes of a Lagrange interpolator on the same (uniform) grid
+state_table = {epoch: tabulated_ephemeris.cartesian_state(epoch)
+               for epoch in np.arange(initial_time, final_time, 300.0)}
+for lookup_scheme in [interpolators.binary_search, interpolators.hunting_algorithm]:
+    interpolator = interpolators.create_one_dimensional_vector_interpolator(
+        state_table, interpolators.lagrange_interpolation(6, lookup_scheme=lookup_scheme))
+    print(f"Lagrange, {lookup_scheme}, sorted epochs: {time_per_call(interpolator.interpolate, sorted_epochs):.2f} us/call")
+    print(f"Lagrange, {lookup_scheme}, random epochs: {time_per_call(interpolator.interpolate, random_epochs):.2f} us/call")
@@ -0,0 +1,49 @@
+class EpochCache:
+    """
+    Wrapper around a custom function of time, which only evaluates the function when the epoch differs from that of the
+    previous call, and counts how often the stored value is reused (hits) and how often the function is evaluated
+    (misses).
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.current_time = float("NaN")
+        self.current_value = None
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, current_time: float):
+        if current_time != self.current_time:
+            # Evaluate the function, and set the cache's current time, indicating that it has been updated
+            self.current_value = self.function(current_time)
+            self.current_time = current_time
+            self.misses += 1
+        else:
+            self.hits += 1
+        return self.current_value
+
+
+# Expensive model of the perturbing body's state, shared by all vehicles
+perturber_state = EpochCache(compute_perturber_state)
+
+
+def perturbing_acceleration(vehicle_name: str):
+    vehicle = bodies.get(vehicle_name)
+
+    def acceleration_function(current_time: float):
+        relative_position = perturber_state(current_time)[:3] - vehicle.position
+        return perturber_gravitational_parameter * relative_position / np.linalg.norm(relative_position) ** 3
+
+    return acceleration_function
+
+
+# Use the same cached model in the custom acceleration of each vehicle in the constellation
+acceleration_settings = {
+    vehicle_name: {vehicle_name: [propagation_setup.acceleration.custom_acceleration(
+        perturbing_acceleration(vehicle_name))]}
+    for vehicle_name in vehicle_names}
+
+...
+
+# After the propagation, compare the number of evaluations to the number of calls
+print(f"Perturber state evaluated {perturber_state.misses} times, reused {perturber_state.hits} times")
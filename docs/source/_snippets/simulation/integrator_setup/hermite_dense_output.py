@@ -0,0 +1,29 @@
+# Save the total acceleration of the spacecraft as a dependent variable, in addition to the state
+dependent_variables_to_save = [propagation_setup.dependent_variable.total_acceleration( "Spacecraft" )]
+
+propagator_settings = propagation_setup.propagator.translational(
+    central_bodies,
+    acceleration_models,
+    bodies_to_propagate,
+    initial_state,
+    simulation_start_epoch,
+    integrator_settings,
+    termination_settings,
+    output_variables = dependent_variables_to_save )
+
+# Propagate dynamics
+dynamics_simulator = dynamics.simulator.create_dynamics_simulator( bodies, propagator_settings )
+state_history = dynamics_simulator.propagation_results.state_history
+acceleration_history = dynamics_simulator.propagation_results.dependent_variable_history
+
+# Construct the derivative of the state (velocity and acceleration) at each integration step
+state_derivative_history = {
+    epoch: np.concatenate( ( state[ 3:6 ], acceleration_history[ epoch ] ) )
+    for epoch, state in state_history.items( ) }
+
+# Create a cubic Hermite interpolator, which uses the state and its derivative at both ends of each step
+dense_output = interpolators.create_one_dimensional_vector_interpolator(
+    state_history, interpolators.hermite_spline_interpolation( ), state_derivative_history )
+
+# Retrieve the state at any epoch within the propagation interval
+state_at_epoch = dense_output.interpolate( epoch )
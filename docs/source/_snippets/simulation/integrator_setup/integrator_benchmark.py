@@ -0,0 +1,198 @@
+def create_leo_scenario():
+    """
+    LEO scenario: one day of a 400 km orbit, with J2 gravity and drag (typical fixed step size: 30 s).
+    """
+    body_settings = environment_setup.get_default_body_settings(["Earth"], "Earth", "J2000")
+    body_settings.add_empty_settings("Vehicle")
+    body_settings.get("Vehicle").constant_mass = 400.0
+    body_settings.get("Vehicle").aerodynamic_coefficient_settings = environment_setup.aerodynamic_coefficients.constant(
+        4.0, [1.2, 0.0, 0.0])
+    bodies = environment_setup.create_system_of_bodies(body_settings)
+
+    acceleration_settings = {"Vehicle": dict(Earth=[
+        propagation_setup.acceleration.spherical_harmonic_gravity(2, 0),
+        propagation_setup.acceleration.aerodynamic()])}
+    initial_state = element_conversion.keplerian_to_cartesian_elementwise(
+        gravitational_parameter=bodies.get("Earth").gravitational_parameter,
+        semi_major_axis=6778.0E3, eccentricity=1.0E-3, inclination=np.deg2rad(51.6),
+        argument_of_periapsis=0.0, longitude_of_ascending_node=0.0, true_anomaly=0.0)
+    return bodies, acceleration_settings, "Earth", initial_state, constants.JULIAN_DAY, 30.0
+
+
+def create_geo_scenario():
+    """
+    GEO scenario: ten days of a geostationary orbit, with Earth point-mass gravity and Moon and Sun third-body gravity
+    (typical fixed step size: 300 s).
+    """
+    body_settings = environment_setup.get_default_body_settings(["Earth", "Moon", "Sun"], "Earth", "J2000")
+    body_settings.add_empty_settings("Vehicle")
+    bodies = environment_setup.create_system_of_bodies(body_settings)
+
+    acceleration_settings = {"Vehicle": dict(
+        Earth=[propagation_setup.acceleration.point_mass_gravity()],
+        Moon=[propagation_setup.acceleration.point_mass_gravity()],
+        Sun=[propagation_setup.acceleration.point_mass_gravity()])}
+    initial_state = element_conversion.keplerian_to_cartesian_elementwise(
+        gravitational_parameter=bodies.get("Earth").gravitational_parameter,
+        semi_major_axis=42164.0E3, eccentricity=1.0E-4, inclination=np.deg2rad(0.1),
+        argument_of_periapsis=0.0, longitude_of_ascending_node=0.0, true_anomaly=0.0)
+    return bodies, acceleration_settings, "Earth", initial_state, 10.0 * constants.JULIAN_DAY, 300.0
+
+
+def create_cruise_scenario():
+    """
+    Interplanetary cruise scenario: 200 days of a heliocentric transfer orbit, with Sun, Earth, Mars and Jupiter
+    point-mass gravity (typical fixed step size: 1 hour).
+    """
+    perturbing_bodies = ["Earth", "Mars", "Jupiter"]
+    body_settings = environment_setup.get_default_body_settings(["Sun"] + perturbing_bodies, "Sun", "ECLIPJ2000")
+    body_settings.add_empty_settings("Vehicle")
+    bodies = environment_setup.create_system_of_bodies(body_settings)
+
+    acceleration_settings = {"Vehicle": {
+        body_name: [propagation_setup.acceleration.point_mass_gravity()]
+        for body_name in ["Sun"] + perturbing_bodies}}
+    initial_state = element_conversion.keplerian_to_cartesian_elementwise(
+        gravitational_parameter=bodies.get("Sun").gravitational_parameter,
+        semi_major_axis=1.26 * constants.ASTRONOMICAL_UNIT, eccentricity=0.21, inclination=np.deg2rad(1.0),
+        argument_of_periapsis=0.0, longitude_of_ascending_node=0.0, true_anomaly=np.deg2rad(10.0))
+    return bodies, acceleration_settings, "Sun", initial_state, 200.0 * constants.JULIAN_DAY, 3600.0
+
+
+def variable_step_integrators(tolerance, initial_time_step):
+    """
+    Function that returns the variable step size integrators to compare, for a given (relative and absolute) tolerance.
+    """
+    integrator = propagation_setup.integrator
+    step_size_control = integrator.step_size_control_elementwise_scalar_tolerance(tolerance, tolerance)
+    step_size_validation = integrator.step_size_validation(1.0E-3, np.inf)
+    integrators = {
+        f"RK {coefficient_set.name}": integrator.runge_kutta_variable_step(
+            initial_time_step, coefficient_set, step_size_control, step_size_validation)
+        for coefficient_set in [integrator.CoefficientSets.rkf_45, integrator.CoefficientSets.rkf_78,
+                                integrator.CoefficientSets.rkdp_87, integrator.CoefficientSets.rkf_1210]}
+    integrators["BS (8 steps)"] = integrator.bulirsch_stoer_variable_step(
+        initial_time_step, integrator.ExtrapolationMethodStepSequences.bulirsch_stoer_sequence, 8,
+        step_size_control, step_size_validation)
+    integrators["ABM"] = integrator.adams_bashforth_moulton(
+        initial_time_step, 1.0E-3, np.inf, tolerance, tolerance, 6, 11)
+    return integrators
+
+
+def fixed_step_integrators(time_step):
+    """
+    Function that returns the fixed step size integrators to compare, for a given time step.
+    """
+    integrator = propagation_setup.integrator
+    return {
+        f"RK {coefficient_set.name} (fixed)": integrator.runge_kutta_fixed_step(time_step, coefficient_set)
+        for coefficient_set in [integrator.CoefficientSets.rk_4, integrator.CoefficientSets.rkf_78,
+                                integrator.CoefficientSets.rkdp_87]}
+
+
+def reference_integrator(initial_time_step):
+    """
+    Function that returns the integrator for the reference solution: an extrapolation integrator with a step sequence
+    and number of steps that are not among the compared integrators, at a tight tolerance.
+    """
+    integrator = propagation_setup.integrator
+    return integrator.bulirsch_stoer_variable_step(
+        initial_time_step, integrator.ExtrapolationMethodStepSequences.deufelhard_sequence, 12,
+        integrator.step_size_control_elementwise_scalar_tolerance(1.0E-14, 1.0E-14),
+        integrator.step_size_validation(1.0E-3, np.inf))
+
+
+def propagate(scenario, integrator_settings):
+    """
+    Function that propagates the scenario with the given integrator, and returns the final state, the number of
+    function evaluations and the wall time of the propagation.
+    """
+    bodies, acceleration_settings, central_body, initial_state, duration, _ = scenario
+    acceleration_models = propagation_setup.create_acceleration_models(
+        bodies, acceleration_settings, ["Vehicle"], [central_body])
+    termination_settings = propagation_setup.propagator.time_termination(
+        duration, terminate_exactly_on_final_condition=True)
+    propagator_settings = propagation_setup.propagator.translational(
+        [central_body], acceleration_models, ["Vehicle"], initial_state, 0.0,
+        integrator_settings, termination_settings)
+    propagator_settings.print_settings.disable_all_printing()
+
+    start_time = time.perf_counter()
+    dynamics_simulator = dynamics.simulator.create_dynamics_simulator(bodies, propagator_settings)
+    wall_time = time.perf_counter() - start_time
+
+    propagation_results = dynamics_simulator.propagation_results
+    state_history = propagation_results.state_history
+    final_state = state_history[max(state_history.keys())]
+    function_evaluations = max(propagation_results.cumulative_number_of_function_evaluations_history.values())
+    return final_state, function_evaluations, wall_time
+
+
+def run_benchmark(scenarios, tolerances, step_size_factors, output_file="integrator_benchmark.csv"):
+    """
+    Function that runs the variable step size integrators over all tolerances, and the fixed step size integrators
+    over all step sizes (given as factors of the typical step size of the scenario), for each scenario. It computes
+    the final position error w.r.t. a high-accuracy reference solution, and writes all results to a csv file.
+    """
+    results = []
+    for scenario_name, create_scenario in scenarios.items():
+        scenario = create_scenario()
+        typical_time_step = scenario[-1]
+        reference_final_state, _, _ = propagate(scenario, reference_integrator(typical_time_step))
+
+        cases = [(integrator_name, f"tolerance={tolerance:.0e}", integrator_settings)
+                 for tolerance in tolerances
+                 for integrator_name, integrator_settings in variable_step_integrators(
+                     tolerance, typical_time_step).items()]
+        cases += [(integrator_name, f"step={factor * typical_time_step:g} s", integrator_settings)
+                  for factor in step_size_factors
+                  for integrator_name, integrator_settings in fixed_step_integrators(
+                      factor * typical_time_step).items()]
+
+        for integrator_name, setting, integrator_settings in cases:
+            final_state, function_evaluations, wall_time = propagate(scenario, integrator_settings)
+            position_error = np.linalg.norm(final_state[:3] - reference_final_state[:3])
+            results.append((scenario_name, integrator_name, setting, function_evaluations, wall_time,
+                            position_error))
+            print(f"{scenario_name:8s} {integrator_name:20s} {setting:18s} "
+                  f"fevals={function_evaluations:8d} time={wall_time:8.3f} s error={position_error:.3e} m")
+
+    with open(output_file, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["scenario", "integrator", "setting", "function_evaluations", "wall_time_s",
+                         "final_position_error_m"])
+        writer.writerows(results)
+    return results
+
+
+def plot_work_precision(results):
+    """
+    Function that plots the number of function evaluations against the final position error, with one panel per
+    scenario and one line per integrator.
+    """
+    scenario_names = list(dict.fromkeys(result[0] for result in results))
+    fig, axes = plt.subplots(1, len(scenario_names), figsize=(5 * len(scenario_names), 4), squeeze=False)
+    for axis, scenario_name in zip(axes[0], scenario_names):
+        scenario_results = [result for result in results if result[0] == scenario_name]
+        for integrator_name in dict.fromkeys(result[1] for result in scenario_results):
+            integrator_results = [result for result in scenario_results if result[1] == integrator_name]
+            axis.loglog([result[5] for result in integrator_results], [result[3] for result in integrator_results],
+                        marker="o", label=integrator_name)
+        axis.set_title(scenario_name)
+        axis.set_xlabel("Final position error [m]")
+        axis.set_ylabel("Function evaluations [-]")
+        axis.grid(True, which="both", alpha=0.3)
+    axes[0][0].legend()
+    fig.tight_layout()
+    fig.savefig("integrator_work_precision.png")
+
+
+if __name__ == "__main__":
+    spice.load_standard_kernels()
+
+    scenarios = {"LEO": create_leo_scenario, "GEO": create_geo_scenario, "Cruise": create_cruise_scenario}
+    tolerances = [1.0E-6, 1.0E-8, 1.0E-10, 1.0E-12]
+    step_size_factors = [0.25, 0.5, 1.0, 2.0, 4.0]
+
+    results = run_benchmark(scenarios, tolerances, step_size_factors)
+    plot_work_precision(results)
@@ -1,4 +1,18 @@
-def run_dynamics(arg_1, arg_2, spice=spice.load_standard_kernels()):
+def load_worker_kernels(kernel_files=None):
+    """
+    Function that loads the SPICE kernels once per worker process (the standard kernels, or only the given kernel
+    files), and prints the time that this took.
+    """
+    load_start_time = time.perf_counter()
+    if kernel_files is None:
+        spice.load_standard_kernels()
+    else:
+        for kernel_file in kernel_files:
+            spice.load_kernel(kernel_file)
+    print(f"Process {os.getpid()}: loaded SPICE kernels in {time.perf_counter() - load_start_time:.3f} s")
+
+
+def run_dynamics(arg_1, arg_2):
     """
     Function that creates the initial conditions, termination settings, and propagation settings, and runs
     create_dynamics_simulator() function and returns the state as an array.
@@ -51,7 +65,7 @@ def run_dynamics(arg_1, arg_2, spice=spice.load_standard_kernels()):
     # Create numerical integrator settings
     fixed_step_size = 10.0
     integrator_settings = propagation_setup.integrator.runge_kutta_fixed_step(
-        2.0, integrator.CoefficientSets.rk_4 )
+        fixed_step_size, integrator.CoefficientSets.rk_4 )
 
     # Create propagation settings
     propagator_settings = propagation_setup.propagator.translational(
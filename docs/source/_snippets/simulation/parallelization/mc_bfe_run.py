@@ -17,6 +17,6 @@ if __name__ == "__main__":
     for k in range(len(arg_dict[0])):
         inputs.append(tuple(arg_dict[p][k] for p in range(2)))
 
-    # Run parallel MC analysis
-    with mp.get_context("spawn").Pool(n_cores) as pool:
+    # Run parallel MC analysis, loading the SPICE kernels once in every worker
+    with mp.get_context("spawn").Pool(n_cores, initializer=load_worker_kernels) as pool:
         outputs = pool.starmap(run_dynamics, inputs)
@@ -0,0 +1,45 @@
+def create_result_slab(shape):
+    """
+    Function that allocates a shared memory block, and returns it together with a NumPy view of the given shape on it.
+    The view is initialized with NaN, so that rows that are not written by any sample can be recognized.
+    """
+    shared_memory_block = shared_memory.SharedMemory(
+        create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+    slab = np.ndarray(shape, dtype=np.float64, buffer=shared_memory_block.buf)
+    slab.fill(np.nan)
+    return shared_memory_block, slab
+
+
+def initialize_shared_worker(slab_specifications, kernel_files=None):
+    """
+    Function that creates the environment once per worker (see initialize_worker()), and attaches the worker to the
+    shared memory blocks created by the parent process. The slab_specifications are given as a dict, with the name of
+    the result as key (e.g. "state_history"), and a tuple with the shared memory block name and slab shape as value.
+    """
+    initialize_worker(kernel_files)
+
+    worker_cache["result_memory"] = dict()
+    worker_cache["result_slabs"] = dict()
+    for result_name, (memory_name, shape) in slab_specifications.items():
+        shared_memory_block = shared_memory.SharedMemory(name=memory_name)
+        # Keep a reference to the block, since the view is only valid as long as the block is open
+        worker_cache["result_memory"][result_name] = shared_memory_block
+        worker_cache["result_slabs"][result_name] = np.ndarray(
+            shape, dtype=np.float64, buffer=shared_memory_block.buf)
+
+
+def run_dynamics_to_slab(sample_index, arg_1, arg_2):
+    """
+    Function that runs the dynamics for a single sample and writes the state history directly into the row of the
+    shared slab belonging to this sample. Only the sample index and the number of written epochs are sent back to the
+    parent process. An error is raised if the state history does not fit in the slab.
+    """
+    states_array, sample_time, setup_time, process_id = run_dynamics(arg_1, arg_2)
+
+    state_slab = worker_cache["result_slabs"]["state_history"]
+    number_of_epochs = len(states_array)
+    if number_of_epochs > state_slab.shape[1]:
+        raise ValueError(f"Sample {sample_index} has {number_of_epochs} epochs, but the slab only has room for "
+                         f"{state_slab.shape[1]}; increase the maximum number of epochs of the slab.")
+    state_slab[sample_index, :number_of_epochs] = states_array
+    return sample_index, number_of_epochs
@@ -0,0 +1,35 @@
+if __name__ == "__main__":
+
+    #Monte Carlo parameters
+    bounds = [[7000e3, 8000e3], [0.1, 0.6]] # Semi-major Axis and Eccentricity are tested here
+    N = 2000
+    n_cores = 4
+
+    # Maximum number of epochs in a single state history (one day with a 10 s fixed step), and number of columns
+    # (epoch and Cartesian state)
+    number_of_epochs = int(constants.JULIAN_DAY / 10.0) + 1
+    number_of_columns = 7
+
+    # Setup inputs for MC with BFE, with the sample index as first argument
+    inputs = [(index,) + sample for index, sample in enumerate(
+        zip(*(np.random.uniform(bound[0], bound[1], size=N) for bound in bounds)))]
+
+    # Preallocate the shared result slab for all samples
+    state_memory, state_slab = create_result_slab((N, number_of_epochs, number_of_columns))
+    slab_specifications = {"state_history": (state_memory.name, state_slab.shape)}
+
+    # Run parallel MC analysis, the workers write their results directly into the slab
+    with mp.get_context("spawn").Pool(
+            n_cores, initializer=initialize_shared_worker, initargs=(slab_specifications,)) as pool:
+        outputs = pool.starmap(run_dynamics_to_slab, inputs)
+
+    # The results are available as views on the shared memory, without unpickling
+    number_of_written_epochs = dict(outputs)
+    first_state_history = state_slab[0, :number_of_written_epochs[0]]
+
+    # ... post-process the results here, copying anything that should outlive the shared memory block ...
+
+    # Release the shared memory block, after deleting all views on it
+    del first_state_history, state_slab
+    state_memory.close()
+    state_memory.unlink()
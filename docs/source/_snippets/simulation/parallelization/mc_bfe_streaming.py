@@ -0,0 +1,109 @@
+def run_dynamics_streaming(sample_index, arg_1, arg_2):
+    """
+    Function that runs the dynamics for a single sample with the environment cached in the worker (see
+    initialize_worker()), and returns the sample index, the state and dependent variable histories as arrays, and the
+    termination reason of the propagation.
+    """
+    bodies = worker_cache["bodies"]
+    propagator_settings = worker_cache["propagator_settings"]
+
+    # Swap the initial state for this sample
+    set_sample_initial_state(bodies, propagator_settings, arg_1, arg_2)
+
+    # Create simulation object and propagate the dynamics
+    dynamics_simulator = dynamics.simulator.create_dynamics_simulator(
+        bodies, propagator_settings
+    )
+    propagation_results = dynamics_simulator.propagation_results
+
+    states = result2array(propagation_results.state_history)
+    dependent_variable_history = propagation_results.dependent_variable_history
+    dependent_variables = result2array(dependent_variable_history) if len(dependent_variable_history) > 0 \
+        else np.empty((0, 1))
+    termination_reason = int(propagation_results.termination_details.termination_reason)
+
+    return sample_index, states, dependent_variables, termination_reason
+
+
+def run_dynamics_streaming_unpacked(arguments):
+    """
+    Function that unpacks the arguments for run_dynamics_streaming(), since imap_unordered() only passes a single
+    argument.
+    """
+    return run_dynamics_streaming(*arguments)
+
+
+def savez_atomic(file_name, **arrays):
+    """
+    Function that writes the arrays to a .npz file, by first writing them under a temporary name and then renaming the
+    file, such that an interrupted write never leaves an incomplete file behind.
+    """
+    temporary_file = file_name + ".tmp.npz"
+    np.savez(temporary_file, **arrays)
+    os.replace(temporary_file, file_name)
+
+
+def write_chunk(output_directory, chunk_index, chunk_outputs):
+    """
+    Function that writes the results of a completed chunk to a single .npz file. The histories of all samples in the
+    chunk are stacked row-wise, with the offsets array giving the first row of each sample. The file is written
+    atomically, such that only complete chunks are ever present on disk.
+    """
+    chunk_outputs = sorted(chunk_outputs, key=lambda output: output[0])
+    sample_indices, states, dependent_variables, termination_reasons = zip(*chunk_outputs)
+
+    savez_atomic(
+        os.path.join(output_directory, f"chunk_{chunk_index:05d}.npz"),
+        sample_index=np.array(sample_indices),
+        termination_reason=np.array(termination_reasons),
+        state_offsets=np.cumsum([0] + [len(history) for history in states]),
+        state_history=np.concatenate(states),
+        dependent_variable_offsets=np.cumsum([0] + [len(history) for history in dependent_variables]),
+        dependent_variable_history=np.concatenate(dependent_variables),
+    )
+
+
+def run_streaming_monte_carlo(inputs, output_directory, n_cores, chunk_size=500, kernel_files=None):
+    """
+    Function that runs all samples in chunks of chunk_size, and writes each chunk to disk as soon as all its samples
+    are finished. Chunks for which a file already exists are skipped, such that an interrupted analysis can be resumed
+    by calling this function again with the same inputs, output directory and chunk size. The chunk size and number of
+    samples are stored on the first call, and checked when resuming, since the chunk files are only valid for these.
+    The kernel_files are passed to initialize_worker(), to load only the given SPICE kernels in every worker.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+
+    settings_file = os.path.join(output_directory, "chunk_settings.npz")
+    if os.path.exists(settings_file):
+        with np.load(settings_file) as settings:
+            if int(settings["chunk_size"]) != chunk_size or int(settings["number_of_samples"]) != len(inputs):
+                raise ValueError(
+                    f"The results in {output_directory} were created with a chunk size of {int(settings['chunk_size'])} "
+                    f"and {int(settings['number_of_samples'])} samples; resume with the same values.")
+    else:
+        savez_atomic(settings_file, chunk_size=chunk_size, number_of_samples=len(inputs))
+
+    indexed_inputs = [(index,) + tuple(sample) for index, sample in enumerate(inputs)]
+    chunks = [indexed_inputs[index:index + chunk_size] for index in range(0, len(indexed_inputs), chunk_size)]
+
+    with mp.get_context("spawn").Pool(n_cores, initializer=initialize_worker, initargs=(kernel_files,)) as pool:
+        for chunk_index, chunk_inputs in enumerate(chunks):
+            if os.path.exists(os.path.join(output_directory, f"chunk_{chunk_index:05d}.npz")):
+                print(f"Chunk {chunk_index + 1} / {len(chunks)} already completed, skipping")
+                continue
+
+            # Only the results of the current chunk are held in memory
+            chunk_outputs = list(pool.imap_unordered(
+                run_dynamics_streaming_unpacked, chunk_inputs))
+            write_chunk(output_directory, chunk_index, chunk_outputs)
+            print(f"Chunk {chunk_index + 1} / {len(chunks)} completed")
+
+
+def load_sample(output_directory, chunk_index, position_in_chunk):
+    """
+    Function that reads the state history of a single sample from a chunk file. Within a chunk, the samples are
+    stored in order of their sample index.
+    """
+    with np.load(os.path.join(output_directory, f"chunk_{chunk_index:05d}.npz")) as chunk:
+        offsets = chunk["state_offsets"]
+        return chunk["state_history"][offsets[position_in_chunk]:offsets[position_in_chunk + 1]]
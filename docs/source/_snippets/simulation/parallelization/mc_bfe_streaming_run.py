@@ -0,0 +1,23 @@
+if __name__ == "__main__":
+
+    #Monte Carlo parameters
+    bounds = [[7000e3, 8000e3], [0.1, 0.6]] # Semi-major Axis and Eccentricity are tested here
+    N = 20000
+    n_cores = 4
+    output_directory = "mc_results"
+
+    # Store the inputs on the first run, and reuse them when resuming, such that every chunk keeps the same samples
+    inputs_file = os.path.join(output_directory, "inputs.npz")
+    if os.path.exists(inputs_file):
+        with np.load(inputs_file) as stored_inputs:
+            inputs = stored_inputs["inputs"]
+    else:
+        os.makedirs(output_directory, exist_ok=True)
+        inputs = np.column_stack([np.random.uniform(bound[0], bound[1], size=N) for bound in bounds])
+        savez_atomic(inputs_file, inputs=inputs)
+
+    # Run parallel MC analysis, writing the results to disk chunk by chunk
+    run_streaming_monte_carlo(inputs, output_directory, n_cores, chunk_size=500)
+
+    # Read back the state history of the first sample
+    first_state_history = load_sample(output_directory, 0, 0)
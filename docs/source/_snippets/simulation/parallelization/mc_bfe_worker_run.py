@@ -0,0 +1,23 @@
+if __name__ == "__main__":
+
+    #Monte Carlo parameters
+    bounds = [[7000e3, 8000e3], [0.1, 0.6]] # Semi-major Axis and Eccentricity are tested here
+    N = 2000
+    n_cores = 4
+
+    # Setup inputs for MC with BFE
+    inputs = list(zip(*(np.random.uniform(bound[0], bound[1], size=N) for bound in bounds)))
+
+    # Run parallel MC analysis, with the environment created once per worker by the initializer
+    with mp.get_context("spawn").Pool(n_cores, initializer=initialize_worker) as pool:
+        outputs = pool.starmap(run_dynamics, inputs)
+
+    states = [output[0] for output in outputs]
+    sample_times = np.array([output[1] for output in outputs])
+    setup_times = np.array([output[2] for output in outputs])
+
+    # Every sample saves the setup it would otherwise have repeated, except for the one setup done by each worker
+    setup_time_per_worker = {output[3]: output[2] for output in outputs}
+    print(f"Mean propagation time per sample:   {np.mean(sample_times):.4f} s")
+    print(f"Setup time saved per sample:        {np.mean(setup_times):.4f} s")
+    print(f"Total setup time saved:             {np.sum(setup_times) - sum(setup_time_per_worker.values()):.1f} s")
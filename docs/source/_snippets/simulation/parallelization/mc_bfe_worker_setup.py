@@ -0,0 +1,100 @@
+# Per-process cache, filled once by the pool initializer of each worker
+worker_cache = dict()
+
+
+def initialize_worker(kernel_files=None):
+    """
+    Function that loads the SPICE kernels (the standard kernels, or only the given kernel files), creates the system
+    of bodies, the acceleration models and the propagator settings once per worker process, and stores them in the
+    per-process cache. The stored setup time only includes the creation of the bodies and settings, since the kernels
+    are also loaded only once per worker without the cache.
+    """
+    # Load spice kernels (only once per worker)
+    load_worker_kernels(kernel_files)
+
+    setup_start_time = time.perf_counter()
+
+    # Set simulation start and end epochs
+    simulation_start_epoch = 0.0
+    simulation_end_epoch = constants.JULIAN_DAY
+
+    # Create default body settings for "Earth", with "Earth"/"J2000" as the global frame origin and orientation
+    bodies_to_create = ["Earth"]
+    global_frame_origin = "Earth"
+    global_frame_orientation = "J2000"
+    body_settings = environment_setup.get_default_body_settings(
+        bodies_to_create, global_frame_origin, global_frame_orientation)
+
+    # Create system of bodies (in this case only Earth)
+    bodies = environment_setup.create_system_of_bodies(body_settings)
+    bodies.create_empty_body("Delfi-C3")
+    bodies_to_propagate = ["Delfi-C3"]
+    central_bodies = ["Earth"]
+
+    # Define accelerations acting on Delfi-C3 and create acceleration models
+    acceleration_settings = {"Delfi-C3": dict(Earth=[propagation_setup.acceleration.point_mass_gravity()])}
+    acceleration_models = propagation_setup.create_acceleration_models(
+        bodies, acceleration_settings, bodies_to_propagate, central_bodies
+    )
+
+    # Create termination and integrator settings
+    termination_settings = propagation_setup.propagator.time_termination(simulation_end_epoch)
+    integrator_settings = propagation_setup.integrator.runge_kutta_fixed_step(
+        10.0, propagation_setup.integrator.CoefficientSets.rk_4 )
+
+    # Create propagation settings, with a placeholder initial state that is replaced for every sample
+    propagator_settings = propagation_setup.propagator.translational(
+        central_bodies,
+        acceleration_models,
+        bodies_to_propagate,
+        np.zeros(6),
+        simulation_start_epoch,
+        integrator_settings,
+        termination_settings
+    )
+
+    worker_cache["bodies"] = bodies
+    worker_cache["propagator_settings"] = propagator_settings
+    worker_cache["setup_time"] = time.perf_counter() - setup_start_time
+
+
+def set_sample_initial_state(bodies, propagator_settings, arg_1, arg_2):
+    """
+    Function that replaces the initial state in the (cached) propagation settings by the initial state of the sample,
+    defined by its semi-major axis (arg_1) and eccentricity (arg_2).
+    """
+    earth_gravitational_parameter = bodies.get("Earth").gravitational_parameter
+    propagator_settings.initial_states = element_conversion.keplerian_to_cartesian_elementwise(
+        gravitational_parameter=earth_gravitational_parameter,
+        semi_major_axis=arg_1,
+        eccentricity=arg_2,
+        inclination=np.deg2rad(85.3),
+        argument_of_periapsis=np.deg2rad(235.7),
+        longitude_of_ascending_node=np.deg2rad(23.4),
+        true_anomaly=np.deg2rad(139.87),
+    )
+
+
+def run_dynamics(arg_1, arg_2):
+    """
+    Function that only swaps the initial state in the cached propagation settings, runs the
+    create_dynamics_simulator() function and returns the state as an array, together with the time spent on the
+    propagation, the (one-time) setup time of the worker and the process id of the worker.
+    """
+    bodies = worker_cache["bodies"]
+    propagator_settings = worker_cache["propagator_settings"]
+
+    sample_start_time = time.perf_counter()
+
+    # Swap the initial state for this sample
+    set_sample_initial_state(bodies, propagator_settings, arg_1, arg_2)
+
+    # Create simulation object and propagate the dynamics
+    dynamics_simulator = dynamics.simulator.create_dynamics_simulator(
+        bodies, propagator_settings
+    )
+    sample_time = time.perf_counter() - sample_start_time
+
+    # Extract the resulting state history and convert it to an ndarray
+    states = dynamics_simulator.propagation_results.state_history
+    return result2array(states), sample_time, worker_cache["setup_time"], os.getpid()
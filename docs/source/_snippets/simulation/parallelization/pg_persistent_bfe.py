@@ -0,0 +1,77 @@
+# Per-process cache, holding the copy of the problem of each worker
+fitness_worker_cache = dict()
+
+
+def initialize_fitness_worker(problem):
+    """
+    Function that stores the problem in the per-process cache, once per worker process.
+    """
+    fitness_worker_cache["problem"] = problem
+
+
+def evaluate_fitness_chunk(design_parameter_vectors):
+    """
+    Function that evaluates the fitness of a chunk of design parameter vectors, using the cached problem.
+    """
+    problem = fitness_worker_cache["problem"]
+    return [problem.fitness(dpv) for dpv in design_parameter_vectors]
+
+
+class PersistentPoolBfe:
+    """
+    User-defined batch fitness evaluator (UDBFE) that keeps its pool of worker processes, and the copy of the problem in
+    each worker, alive for the whole optimisation. The pool is created on the first call, and reused for every next
+    generation, until shutdown_pool() is called.
+    """
+
+    # The pool is stored at class level, since PyGMO deep-copies the UDBFE when it is passed to pygmo.bfe()
+    _pool = None
+    _pool_problem_key = None
+
+    def __init__(self, n_processes: int = None):
+        self.n_processes = n_processes if n_processes is not None else mp.cpu_count()
+
+    @staticmethod
+    def _problem_key(prob: pg.problem) -> str:
+        """
+        Function that returns a hash of the pickled user-defined problem, which identifies the problem including its
+        attributes (bounds, transfer body order, etc.), rather than only its class.
+        """
+        return hashlib.sha256(pickle.dumps(prob.extract(object))).hexdigest()
+
+    def __call__(self, prob: pg.problem, dvs: np.ndarray) -> np.ndarray:
+
+        # Start the pool once, each worker receives its own copy of the problem only at start-up
+        problem_key = self._problem_key(prob)
+        if PersistentPoolBfe._pool is None:
+            PersistentPoolBfe._pool = mp.get_context("spawn").Pool(
+                self.n_processes, initializer=initialize_fitness_worker, initargs=(prob,))
+            PersistentPoolBfe._pool_problem_key = problem_key
+        elif PersistentPoolBfe._pool_problem_key != problem_key:
+            raise RuntimeError("The worker pool was started for another problem, call shutdown_pool() first.")
+
+        # Split the population in one chunk per worker
+        design_parameter_vectors = dvs.reshape(-1, prob.get_nx())
+        chunk_size = int(np.ceil(len(design_parameter_vectors) / self.n_processes))
+        chunks = [design_parameter_vectors[index:index + chunk_size]
+                  for index in range(0, len(design_parameter_vectors), chunk_size)]
+
+        outputs = PersistentPoolBfe._pool.map(evaluate_fitness_chunk, chunks)
+
+        # The fitness evaluations happened in the workers, so the counter of the parent problem is increased here
+        prob.increment_fevals(len(design_parameter_vectors))
+        return np.concatenate([np.ravel(fitness) for output in outputs for fitness in output])
+
+    def get_name(self) -> str:
+        return "Persistent pool batch fitness evaluator"
+
+    @classmethod
+    def shutdown_pool(cls):
+        """
+        Function that closes the worker pool, to be called once the optimisation has finished.
+        """
+        if cls._pool is not None:
+            cls._pool.close()
+            cls._pool.join()
+            cls._pool = None
+            cls._pool_problem_key = None
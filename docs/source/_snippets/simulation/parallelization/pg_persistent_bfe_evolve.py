@@ -0,0 +1,44 @@
+if __name__ == "__main__":
+    seed = 42
+    pop_size = 500
+    n_processes = 4
+
+# Create Pygmo problem
+    transfer_optimization_problem = MGAHodographicShapingTrajectoryOptimizationProblem(
+        central_body, transfer_body_order, bounds, departure_semi_major_axis, departure_eccentricity,
+        arrival_semi_major_axis, arrival_eccentricity)
+    prob = pg.problem(transfer_optimization_problem)
+
+# Create the batch fitness evaluator, the same way as pygmo.bfe() would be used
+    bfe = pg.bfe(PersistentPoolBfe(n_processes))
+
+# Create algorithm and define its seed
+    algo = pg.gaco()
+    algo.set_bfe(bfe)
+    algo = pg.algorithm(algo)
+
+    num_gen = 150
+
+# Initialize lists with the best individual per generation
+    list_of_champion_f = []
+    list_of_champion_x = []
+
+# mp.freeze_support() needs to be called when using multiprocessing on windows
+# mp.freeze_support()
+
+# Close the worker pool when the optimisation has finished, also if it is interrupted by an exception
+    try:
+        pop = pg.population(prob=prob, size=pop_size, seed=seed, b=bfe)
+        list_of_champion_f.append(pop.champion_f)
+        list_of_champion_x.append(pop.champion_x)
+
+        for i in range(num_gen):
+            print(f'Evolution: {i+1} / {num_gen}', end='\r')
+            pop = algo.evolve(pop)
+
+            # Save current champion
+            list_of_champion_x.append(pop.champion_x)
+            list_of_champion_f.append(pop.champion_f)
+        print('Evolution finished')
+    finally:
+        PersistentPoolBfe.shutdown_pool()
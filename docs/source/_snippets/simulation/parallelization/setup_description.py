@@ -0,0 +1,113 @@
+@dataclasses.dataclass
+class SimulationSetup:
+    """
+    Picklable description of the simulation setup, containing only plain Python values and NumPy arrays. The tudatpy
+    objects are created from it inside every process by create_simulation_objects().
+    """
+    bodies_to_create: list
+    global_frame_origin: str
+    global_frame_orientation: str
+    propagated_body: str
+    central_body: str
+    # Accelerations on the propagated body, per exerting body, as (name of the acceleration function, arguments)
+    # tuples, e.g. {"Earth": [("spherical_harmonic_gravity", (8, 8))], "Moon": [("point_mass_gravity", ())]}
+    accelerations: dict
+    # Initial Kepler elements (a, e, i, omega, RAAN, theta) of the propagated body w.r.t. the central body
+    initial_keplerian_elements: np.ndarray
+    simulation_start_epoch: float
+    simulation_end_epoch: float
+    fixed_step_size: float
+    # Tabulated data (e.g. a state history of a body) is stored as raw arrays
+    tabulated_epochs: dict = dataclasses.field(default_factory=dict)
+    tabulated_states: dict = dataclasses.field(default_factory=dict)
+
+
+def create_simulation_objects(setup):
+    """
+    Function that creates the system of bodies and the propagator settings from the setup description.
+    """
+    body_settings = environment_setup.get_default_body_settings(
+        setup.bodies_to_create, setup.global_frame_origin, setup.global_frame_orientation)
+    for body_name, epochs in setup.tabulated_epochs.items():
+        body_settings.get(body_name).ephemeris_settings = environment_setup.ephemeris.tabulated(
+            dict(zip(epochs, setup.tabulated_states[body_name])),
+            setup.global_frame_origin, setup.global_frame_orientation)
+    bodies = environment_setup.create_system_of_bodies(body_settings)
+    bodies.create_empty_body(setup.propagated_body)
+
+    acceleration_settings = {setup.propagated_body: {
+        exerting_body: [getattr(propagation_setup.acceleration, name)(*arguments) for name, arguments in accelerations]
+        for exerting_body, accelerations in setup.accelerations.items()}}
+    acceleration_models = propagation_setup.create_acceleration_models(
+        bodies, acceleration_settings, [setup.propagated_body], [setup.central_body])
+
+    initial_state = element_conversion.keplerian_to_cartesian(
+        setup.initial_keplerian_elements, bodies.get(setup.central_body).gravitational_parameter)
+    propagator_settings = propagation_setup.propagator.translational(
+        [setup.central_body],
+        acceleration_models,
+        [setup.propagated_body],
+        initial_state,
+        setup.simulation_start_epoch,
+        propagation_setup.integrator.runge_kutta_fixed_step(
+            setup.fixed_step_size, propagation_setup.integrator.CoefficientSets.rk_4),
+        propagation_setup.propagator.time_termination(setup.simulation_end_epoch))
+    propagator_settings.print_settings.disable_all_printing()
+    return bodies, propagator_settings
+
+
+class OrbitProblem:
+    """
+    Example of a PyGMO problem (or any other object that is sent to other processes), which stores only the setup
+    description. The tudatpy objects are created on first use in each process, and are excluded when pickling.
+    The design parameters are the initial semi-major axis and eccentricity, and the fitness is the difference between
+    the maximum and minimum distance to the central body during the propagation.
+    """
+
+    def __init__(self, setup, design_bounds):
+        self.setup = setup
+        self.design_bounds = design_bounds
+        self._simulation_objects = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_simulation_objects"] = None
+        return state
+
+    def get_simulation_objects(self):
+        if self._simulation_objects is None:
+            self._simulation_objects = create_simulation_objects(self.setup)
+        return self._simulation_objects
+
+    def get_bounds(self):
+        return self.design_bounds
+
+    def fitness(self, design_parameter_vector):
+        bodies, propagator_settings = self.get_simulation_objects()
+
+        # Replace the semi-major axis and eccentricity of the initial state by the design parameters
+        initial_keplerian_elements = np.array(self.setup.initial_keplerian_elements, dtype=float)
+        initial_keplerian_elements[:2] = design_parameter_vector
+        propagator_settings.initial_states = element_conversion.keplerian_to_cartesian(
+            initial_keplerian_elements, bodies.get(self.setup.central_body).gravitational_parameter)
+
+        dynamics_simulator = dynamics.simulator.create_dynamics_simulator(bodies, propagator_settings)
+        states = result2array(dynamics_simulator.propagation_results.state_history)
+        distances = np.linalg.norm(states[:, 1:4], axis=1)
+        return [np.max(distances) - np.min(distances)]
+
+
+# Describe the setup in the parent process, and create the problem that is sent to the islands
+setup = SimulationSetup(
+    bodies_to_create=["Earth", "Moon"],
+    global_frame_origin="Earth",
+    global_frame_orientation="J2000",
+    propagated_body="Delfi-C3",
+    central_body="Earth",
+    accelerations={"Earth": [("spherical_harmonic_gravity", (8, 8))], "Moon": [("point_mass_gravity", ())]},
+    initial_keplerian_elements=np.array(
+        [7500.0E3, 0.1, np.deg2rad(85.3), np.deg2rad(235.7), np.deg2rad(23.4), np.deg2rad(139.87)]),
+    simulation_start_epoch=0.0,
+    simulation_end_epoch=constants.JULIAN_DAY,
+    fixed_step_size=10.0)
+problem = pg.problem(OrbitProblem(setup, ([7000.0E3, 0.0], [8000.0E3, 0.2])))
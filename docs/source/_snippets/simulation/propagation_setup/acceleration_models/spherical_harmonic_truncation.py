@@ -0,0 +1,77 @@
+def degree_accelerations(gravity_field, radius):
+    """
+    Function that returns the (root-mean-square over a sphere of the given radius) acceleration produced by each
+    degree of a spherical harmonic gravity field, using the fully normalized coefficients of the field.
+    """
+    cosine_coefficients = gravity_field.cosine_coefficients
+    sine_coefficients = gravity_field.sine_coefficients
+    degrees = np.arange(cosine_coefficients.shape[0])
+
+    degree_rms = np.sqrt(np.sum(cosine_coefficients ** 2 + sine_coefficients ** 2, axis=1))
+    return (gravity_field.gravitational_parameter / radius ** 2 *
+            (gravity_field.reference_radius / radius) ** degrees *
+            np.sqrt((degrees + 1) * (2 * degrees + 1)) * degree_rms)
+
+
+def truncation_degree(gravity_field, radius, acceleration_tolerance, maximum_degree):
+    """
+    Function that returns the lowest degree for which the combined acceleration of all omitted degrees (up to the
+    maximum degree) is below the given tolerance, at the given radius.
+    """
+    accelerations = degree_accelerations(gravity_field, radius)[:maximum_degree + 1]
+    omitted_acceleration = np.cumsum(accelerations[::-1])[::-1]
+    sufficient_degrees = np.nonzero(omitted_acceleration < acceleration_tolerance)[0]
+    return max(sufficient_degrees[0] - 1, 2) if len(sufficient_degrees) > 0 else maximum_degree
+
+
+def propagate_with_radius_dependent_degree(
+        bodies, create_propagator_settings, initial_state, initial_time, final_time, radius_bands):
+    """
+    Function that propagates the dynamics in segments, where each segment uses the degree of the radius band that
+    the vehicle is in, and is terminated when the vehicle leaves this band (or when the final time is reached).
+    The radius_bands input is a list of (lower radius, upper radius, degree) tuples, and create_propagator_settings
+    is a function that creates the propagator settings from the degree, initial state, initial time and termination
+    settings.
+    """
+    radius_dependent_variable = propagation_setup.dependent_variable.relative_distance("Vehicle", "Earth")
+    # Root finder that determines the epoch at which a band limit is crossed to within 1 ms
+    band_limit_root_finder = root_finders.secant(absolute_variable_tolerance=1.0E-3, maximum_iteration=50)
+    state_history = dict()
+    current_state, current_time = initial_state, initial_time
+    while current_time < final_time:
+        # Select the band from the position one second ahead, so that a segment that ended on a band limit is
+        # followed by a segment in the band that the vehicle is moving into
+        radius = np.linalg.norm(current_state[:3] + current_state[3:])
+        band_index = next(index for index, (lower_radius, upper_radius, _) in enumerate(radius_bands)
+                          if lower_radius <= radius < upper_radius)
+        lower_radius, upper_radius, degree = radius_bands[band_index]
+
+        # Terminate exactly when the vehicle leaves the current band, or at the final time
+        termination_conditions = [propagation_setup.propagator.time_termination(
+            final_time, terminate_exactly_on_final_condition=True)]
+        if band_index > 0:
+            termination_conditions.append(propagation_setup.propagator.dependent_variable_termination(
+                radius_dependent_variable, lower_radius, use_as_lower_limit=True,
+                terminate_exactly_on_final_condition=True,
+                termination_root_finder_settings=band_limit_root_finder))
+        if band_index < len(radius_bands) - 1:
+            termination_conditions.append(propagation_setup.propagator.dependent_variable_termination(
+                radius_dependent_variable, upper_radius, use_as_lower_limit=False,
+                terminate_exactly_on_final_condition=True,
+                termination_root_finder_settings=band_limit_root_finder))
+        termination_settings = propagation_setup.propagator.hybrid_termination(
+            termination_conditions, fulfill_single_condition=True)
+
+        propagator_settings = create_propagator_settings(degree, current_state, current_time, termination_settings)
+        segment_state_history = dynamics.simulator.create_dynamics_simulator(
+            bodies, propagator_settings).propagation_results.state_history
+        state_history.update(segment_state_history)
+
+        segment_end_time = max(segment_state_history.keys())
+        if segment_end_time <= current_time:
+            raise RuntimeError(
+                f"Propagation segment starting at {current_time} s did not advance; check the radius bands.")
+        current_time = segment_end_time
+        current_state = segment_state_history[current_time]
+
+    return state_history
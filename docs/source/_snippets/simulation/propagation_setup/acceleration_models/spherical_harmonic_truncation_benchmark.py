@@ -0,0 +1,64 @@
+# Define Molniya orbit, propagated for two days
+earth_gravity_field = bodies.get("Earth").gravity_field_model
+semi_major_axis = 26600.0E3
+eccentricity = 0.74
+perigee_radius = semi_major_axis * (1.0 - eccentricity)
+initial_state = element_conversion.keplerian_to_cartesian_elementwise(
+    gravitational_parameter=earth_gravity_field.gravitational_parameter,
+    semi_major_axis=semi_major_axis, eccentricity=eccentricity, inclination=np.deg2rad(63.4),
+    argument_of_periapsis=np.deg2rad(270.0), longitude_of_ascending_node=0.0, true_anomaly=0.0)
+simulation_start_epoch = 0.0
+simulation_end_epoch = 2.0 * constants.JULIAN_DAY
+
+
+def create_propagator_settings(degree, initial_state, initial_time, termination_settings):
+    acceleration_settings = {"Vehicle": dict(
+        Earth=[propagation_setup.acceleration.spherical_harmonic_gravity(degree, degree)])}
+    acceleration_models = propagation_setup.create_acceleration_models(
+        bodies, acceleration_settings, ["Vehicle"], ["Earth"])
+    integrator_settings = propagation_setup.integrator.runge_kutta_fixed_step(
+        10.0, propagation_setup.integrator.CoefficientSets.rk_4)
+    propagator_settings = propagation_setup.propagator.translational(
+        ["Earth"], acceleration_models, ["Vehicle"], initial_state, initial_time,
+        integrator_settings, termination_settings)
+    propagator_settings.print_settings.disable_all_printing()
+    return propagator_settings
+
+
+def propagate_with_fixed_degree(degree):
+    termination_settings = propagation_setup.propagator.time_termination(
+        simulation_end_epoch, terminate_exactly_on_final_condition=True)
+    propagator_settings = create_propagator_settings(
+        degree, initial_state, simulation_start_epoch, termination_settings)
+    return dynamics.simulator.create_dynamics_simulator(bodies, propagator_settings).propagation_results.state_history
+
+
+# Define the degree per radius band for an acceleration tolerance of 1 um/s^2, with the lowest band starting at
+# perigee (for a tighter tolerance, the degree required at perigee may reach the maximum degree)
+maximum_degree = 100
+acceleration_tolerance = 1.0E-6
+radius_limits = [perigee_radius, 8000.0E3, 10000.0E3, 15000.0E3, 25000.0E3, np.inf]
+radius_bands = [(lower_radius, upper_radius,
+                 truncation_degree(earth_gravity_field, lower_radius, acceleration_tolerance, maximum_degree))
+                for lower_radius, upper_radius in zip(radius_limits[:-1], radius_limits[1:])]
+perigee_degree = radius_bands[0][2]
+print("Degree per radius band:", [(lower_radius / 1.0E3, degree) for lower_radius, _, degree in radius_bands])
+
+# Propagate with the full field, with the degree required at perigee, and with a radius-dependent degree
+cases = {
+    f"{maximum_degree}x{maximum_degree}": lambda: propagate_with_fixed_degree(maximum_degree),
+    f"{perigee_degree}x{perigee_degree} (perigee)": lambda: propagate_with_fixed_degree(perigee_degree),
+    "radius-dependent": lambda: propagate_with_radius_dependent_degree(
+        bodies, create_propagator_settings, initial_state, simulation_start_epoch, simulation_end_epoch,
+        radius_bands)}
+
+final_states = dict()
+for case_name, propagate_case in cases.items():
+    start_time = time.perf_counter()
+    state_history = propagate_case()
+    wall_time = time.perf_counter() - start_time
+    final_states[case_name] = state_history[max(state_history.keys())]
+
+    position_difference = np.linalg.norm(
+        final_states[case_name][:3] - final_states[f"{maximum_degree}x{maximum_degree}"][:3])
+    print(f"{case_name:20s} wall time: {wall_time:7.2f} s, final position difference: {position_difference:.3e} m")
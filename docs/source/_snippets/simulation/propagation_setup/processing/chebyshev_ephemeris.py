@@ -0,0 +1,77 @@
+class ChebyshevEphemeris:
+    """
+    Compact ephemeris, storing a state history as piecewise Chebyshev polynomials on segments of equal length (similar
+    to SPK type 3). Since all segments have the same length, the segment of an epoch is found in O(1).
+    """
+
+    def __init__(self, start_epoch, segment_length, coefficients):
+        self.start_epoch = start_epoch
+        self.segment_length = segment_length
+        # Array of shape (number of segments, polynomial degree + 1, 6)
+        self.coefficients = coefficients
+
+    @classmethod
+    def from_state_history(cls, epochs, states, degree=12, tolerance=1.0E-3, initial_number_of_segments=1):
+        """
+        Function that fits the (N, 6) array of states, given at the sorted epochs, with Chebyshev polynomials of the
+        given degree. The number of segments is doubled until the position error of the fit at all epochs is below the
+        tolerance (in meters).
+        """
+        number_of_segments = initial_number_of_segments
+        start_epoch, end_epoch = epochs[0], epochs[-1]
+        while True:
+            segment_length = (end_epoch - start_epoch) / number_of_segments
+            segment_indices = np.minimum(
+                ((epochs - start_epoch) // segment_length).astype(int), number_of_segments - 1)
+            if np.min(np.bincount(segment_indices, minlength=number_of_segments)) <= degree:
+                raise ValueError("Tolerance cannot be met, too few states per segment for the polynomial degree.")
+
+            coefficients = np.empty((number_of_segments, degree + 1, 6))
+            maximum_position_error = 0.0
+            for segment_index in range(number_of_segments):
+                in_segment = segment_indices == segment_index
+                scaled_time = 2.0 * (epochs[in_segment] - start_epoch) / segment_length - 2.0 * segment_index - 1.0
+                coefficients[segment_index] = np.polynomial.chebyshev.chebfit(scaled_time, states[in_segment], degree)
+
+                fitted_positions = np.polynomial.chebyshev.chebval(scaled_time, coefficients[segment_index, :, :3]).T
+                maximum_position_error = max(maximum_position_error, np.max(
+                    np.linalg.norm(fitted_positions - states[in_segment, :3], axis=1)))
+
+            if maximum_position_error <= tolerance:
+                return cls(start_epoch, segment_length, coefficients)
+            number_of_segments *= 2
+
+    def state(self, epoch):
+        """
+        Function that returns the Cartesian state at the given epoch, which must be within the fitted interval.
+        """
+        end_epoch = self.start_epoch + len(self.coefficients) * self.segment_length
+        if not self.start_epoch <= epoch <= end_epoch:
+            raise ValueError(f"Epoch {epoch} is outside the fitted interval [{self.start_epoch}, {end_epoch}].")
+        segment_index = min(int((epoch - self.start_epoch) // self.segment_length), len(self.coefficients) - 1)
+        scaled_time = 2.0 * (epoch - self.start_epoch) / self.segment_length - 2.0 * segment_index - 1.0
+        return np.polynomial.chebyshev.chebval(scaled_time, self.coefficients[segment_index])
+
+    def save(self, file_name):
+        np.savez(file_name, start_epoch=self.start_epoch, segment_length=self.segment_length,
+                 coefficients=self.coefficients)
+
+    @classmethod
+    def load(cls, file_name):
+        with np.load(file_name) as data:
+            return cls(float(data["start_epoch"]), float(data["segment_length"]), data["coefficients"])
+
+
+# Fit the propagated state history of the spacecraft to a position accuracy of 1 m
+state_history = dynamics_simulator.propagation_results.state_history
+epochs = np.fromiter(state_history.keys(), dtype=float, count=len(state_history))
+states = np.vstack(list(state_history.values()))
+spacecraft_ephemeris = ChebyshevEphemeris.from_state_history(epochs, states, degree=12, tolerance=1.0)
+
+# Store the ephemeris on disk
+spacecraft_ephemeris.save("spacecraft_ephemeris.npz")
+
+# Use the ephemeris for the spacecraft in a new system of bodies (w.r.t. the propagation origin)
+body_settings.add_empty_settings("Spacecraft")
+body_settings.get("Spacecraft").ephemeris_settings = environment_setup.ephemeris.custom_ephemeris(
+    ChebyshevEphemeris.load("spacecraft_ephemeris.npz").state, "Earth", "J2000")
@@ -0,0 +1,68 @@
+class TimedCallback:
+    """
+    Wrapper around a Python function (e.g. a custom acceleration or custom dependent variable), which accumulates the
+    wall time spent in, and the number of calls to, this function.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.wall_time = 0.0
+        self.number_of_calls = 0
+
+    def __call__(self, *args):
+        start_time = time.perf_counter()
+        result = self.function(*args)
+        self.wall_time += time.perf_counter() - start_time
+        self.number_of_calls += 1
+        return result
+
+
+def time_per_function_evaluation(bodies, propagator_settings, number_of_repetitions=3):
+    """
+    Function that propagates the dynamics, and returns the (best) wall time per function evaluation, and the
+    number of function evaluations.
+    """
+    propagator_settings.print_settings.disable_all_printing()
+    best_wall_time = np.inf
+    for _ in range(number_of_repetitions):
+        start_time = time.perf_counter()
+        dynamics_simulator = dynamics.simulator.create_dynamics_simulator(bodies, propagator_settings)
+        best_wall_time = min(best_wall_time, time.perf_counter() - start_time)
+
+    function_evaluations = max(
+        dynamics_simulator.propagation_results.cumulative_number_of_function_evaluations_history.values())
+    return best_wall_time / function_evaluations, function_evaluations
+
+
+def propagation_cost_breakdown(bodies, acceleration_settings, dependent_variables, create_propagator_settings):
+    """
+    Function that estimates the cost per function evaluation of each acceleration model, and of the dependent
+    variables, by removing them one at a time from the propagation. The create_propagator_settings input is a
+    function that creates the propagator settings from the acceleration settings and dependent variables.
+    """
+    full_settings = create_propagator_settings(acceleration_settings, dependent_variables)
+    full_cost, function_evaluations = time_per_function_evaluation(bodies, full_settings)
+    cost_breakdown = {"total": full_cost}
+
+    # Cost of each acceleration model, as the difference w.r.t. a propagation without it
+    for body_undergoing, accelerations_on_body in acceleration_settings.items():
+        for body_exerting, accelerations in accelerations_on_body.items():
+            for index in range(len(accelerations)):
+                reduced_accelerations = copy.copy(accelerations_on_body)
+                reduced_accelerations[body_exerting] = accelerations[:index] + accelerations[index + 1:]
+                if not reduced_accelerations[body_exerting]:
+                    del reduced_accelerations[body_exerting]
+                reduced_settings = create_propagator_settings(
+                    {**acceleration_settings, body_undergoing: reduced_accelerations}, dependent_variables)
+                reduced_cost, _ = time_per_function_evaluation(bodies, reduced_settings)
+                model_name = f"acceleration {index} of {body_exerting} on {body_undergoing}"
+                cost_breakdown[model_name] = full_cost - reduced_cost
+
+    # Cost of the dependent variables, as the difference w.r.t. a propagation without them
+    reduced_cost, _ = time_per_function_evaluation(bodies, create_propagator_settings(acceleration_settings, []))
+    cost_breakdown["dependent variables"] = full_cost - reduced_cost
+
+    print(f"Function evaluations: {function_evaluations}")
+    for model_name, cost in cost_breakdown.items():
+        print(f"{model_name:60s} {cost * 1.0E6:10.2f} us/evaluation ({100.0 * cost / full_cost:5.1f} %)")
+    return cost_breakdown
@@ -0,0 +1,49 @@
+def find_events(event_history, state_history, event_direction=0, time_tolerance=1.0E-3):
+    """
+    Function that finds the epochs at which the event function (given as a dictionary of epochs and floats) changes
+    sign, and returns these epochs with the interpolated state at each of them. With an event direction of 1 (or -1),
+    only crossings from negative to positive (or positive to negative) values are returned.
+    """
+    epochs = np.fromiter(event_history.keys(), dtype=float, count=len(event_history))
+    is_negative = np.signbit(np.fromiter(event_history.values(), dtype=float, count=len(event_history)))
+
+    # Detect the intervals between two epochs in which the event function changes sign
+    crossing_indices = np.nonzero(is_negative[:-1] != is_negative[1:])[0]
+    if event_direction > 0:
+        crossing_indices = crossing_indices[is_negative[crossing_indices]]
+    elif event_direction < 0:
+        crossing_indices = crossing_indices[~is_negative[crossing_indices]]
+
+    interpolator_settings = interpolators.lagrange_interpolation(8)
+    event_interpolator = interpolators.create_one_dimensional_scalar_interpolator(
+        event_history, interpolator_settings)
+    state_interpolator = interpolators.create_one_dimensional_vector_interpolator(
+        state_history, interpolator_settings)
+
+    # Refine the epoch of each sign change by bisection on the interpolated event function
+    events = []
+    for crossing_index in crossing_indices:
+        lower_epoch, upper_epoch = epochs[crossing_index], epochs[crossing_index + 1]
+        while upper_epoch - lower_epoch > time_tolerance:
+            middle_epoch = 0.5 * (lower_epoch + upper_epoch)
+            if np.signbit(event_interpolator.interpolate(middle_epoch)) == is_negative[crossing_index]:
+                lower_epoch = middle_epoch
+            else:
+                upper_epoch = middle_epoch
+        event_epoch = 0.5 * (lower_epoch + upper_epoch)
+        events.append((event_epoch, state_interpolator.interpolate(event_epoch)))
+    return events
+
+
+# Retrieve the propagated states, and the altitude (saved as the only dependent variable)
+state_history = dynamics_simulator.propagation_results.state_history
+dependent_variable_history = dynamics_simulator.propagation_results.dependent_variable_history
+
+# Find all crossings of an altitude of 300 km, in either direction
+altitude_event_history = {
+    epoch: dependent_variables[0] - 300.0E3 for epoch, dependent_variables in dependent_variable_history.items()}
+altitude_events = find_events(altitude_event_history, state_history)
+
+# Find all ascending node crossings, where the z-component of the position changes from negative to positive
+node_event_history = {epoch: state[2] for epoch, state in state_history.items()}
+ascending_node_events = find_events(node_event_history, state_history, event_direction=1)
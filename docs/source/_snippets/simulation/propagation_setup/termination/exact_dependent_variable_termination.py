@@ -0,0 +1,9 @@
+# Terminate exactly when the altitude of the vehicle drops below 100 km, with the epoch found to within 1 ms
+termination_settings = propagation_setup.propagator.dependent_variable_termination(
+    dependent_variable_settings=propagation_setup.dependent_variable.altitude("Vehicle", "Earth"),
+    limit_value=100.0E3,
+    use_as_lower_limit=True,
+    terminate_exactly_on_final_condition=True,
+    termination_root_finder_settings=root_finders.secant(
+        absolute_variable_tolerance=1.0E-3,
+        maximum_iteration=50))
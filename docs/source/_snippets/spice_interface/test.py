@@ -1,25 +1,26 @@
 from tudatpy.interface import spice
+import numpy as np
 
 # load tudat standard spice kernels
-spice_interface.load_standard_kernels()
+spice.load_standard_kernels()
 
 # --------------------------------------------------
 #  get gravitational parameter of Earth using spice:
 # --------------------------------------------------
 
 # get GM of Earth using spice bodvrd routine
-EARTH_GM = spice_interface.get_body_gravitational_parameter("Earth")
+EARTH_GM = spice.get_body_gravitational_parameter("Earth")
 
-EARTH_GM = spice_interface.get_body_properties("Earth", "GM", 1)
+EARTH_GM = spice.get_body_properties("Earth", "GM", 1)
 
-EARTH_RADII = spice_interface.get_body_properties("Earth", "RADII", 3)
+EARTH_RADII = spice.get_body_properties("Earth", "RADII", 3)
 
 print(EARTH_RADII)
 
 # --------------------------------------------------
 # get cartesian state of Earth using spice:
 # --------------------------------------------------
-EARTH_STATE = spice_interface.get_body_cartesian_state_at_epoch(
+EARTH_STATE = spice.get_body_cartesian_state_at_epoch(
     target_body_name="Earth",
     observer_body_name="SSB",
     reference_frame_name="ECLIPJ2000",
@@ -27,3 +28,33 @@ EARTH_STATE = spice_interface.get_body_cartesian_state_at_epoch(
     ephemeris_time=0)
 
 print(EARTH_STATE)
+
+# --------------------------------------------------
+# get cartesian states of Earth at many epochs:
+# --------------------------------------------------
+
+def get_body_cartesian_states_at_epochs(
+        target_body_name, observer_body_name, reference_frame_name, aberration_corrections, ephemeris_times):
+    """
+    Function that returns the Cartesian states of the target body w.r.t. the observer body at all given epochs, as an
+    (N, 6) array. The output array is allocated once, and filled row by row.
+    """
+    states = np.empty((len(ephemeris_times), 6))
+    for index, ephemeris_time in enumerate(ephemeris_times):
+        states[index] = spice.get_body_cartesian_state_at_epoch(
+            target_body_name, observer_body_name, reference_frame_name, aberration_corrections, ephemeris_time)
+    return states
+
+
+def get_body_properties_for_bodies(body_names, property_name, maximum_number_of_values):
+    """
+    Function that returns the given property of each of the given bodies, as a dict with the body name as key.
+    """
+    return {body_name: spice.get_body_properties(body_name, property_name, maximum_number_of_values)
+            for body_name in body_names}
+
+
+EARTH_STATES = get_body_cartesian_states_at_epochs(
+    "Earth", "SSB", "ECLIPJ2000", "None", np.linspace(0.0, 86400.0 * 365.25, 10000))
+
+PLANET_GMS = get_body_properties_for_bodies(["Mercury", "Venus", "Earth", "Mars"], "GM", 1)